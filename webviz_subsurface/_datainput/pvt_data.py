@@ -53,25 +53,19 @@ def filter_pvt_data_frame(
     data_frame = data_frame[columns]
 
     stored_data_frames = []
-    cleaned_data_frame = data_frame.iloc[0:0]
+    cleaned_data_frames = []
     columns_subset = data_frame.columns.difference(["REAL", "ENSEMBLE"])
 
     for ens, ens_data_frame in data_frame.groupby("ENSEMBLE"):
-        ens_merged_dataframe = data_frame.iloc[0:0]
-        for _rno, realization_data_frame in ens_data_frame.groupby("REAL"):
-            if ens_merged_dataframe.empty:
-                ens_merged_dataframe = ens_merged_dataframe.append(
-                    realization_data_frame
-                ).reset_index(drop=True)
-            else:
-                ens_merged_dataframe = (
-                    pd.concat([ens_merged_dataframe, realization_data_frame])
-                    .drop_duplicates(
-                        subset=columns_subset,
-                        keep="first",
-                    )
-                    .reset_index(drop=True)
-                )
+        # Merge the realizations with one stable sort and one C-level
+        # drop_duplicates, instead of appending realization by realization
+        # (which reallocates and deduplicates the accumulated frame for
+        # every realization).
+        ens_merged_dataframe = (
+            ens_data_frame.sort_values("REAL", kind="mergesort")
+            .drop_duplicates(subset=columns_subset, keep="first")
+            .reset_index(drop=True)
+        )
 
         if ens_merged_dataframe["REAL"].nunique() > 1:
             warnings.warn(
@@ -97,9 +91,11 @@ def filter_pvt_data_frame(
             if data_frame_stored:
                 continue
             stored_data_frames.append(ens_merged_dataframe)
-        cleaned_data_frame = cleaned_data_frame.append(ens_merged_dataframe)
+        cleaned_data_frames.append(ens_merged_dataframe)
 
-    return cleaned_data_frame
+    if not cleaned_data_frames:
+        return data_frame.iloc[0:0]
+    return pd.concat(cleaned_data_frames)
 
 
 @CACHE.memoize(timeout=CACHE.TIMEOUT)
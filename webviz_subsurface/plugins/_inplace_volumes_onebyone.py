@@ -421,6 +421,12 @@ aggregated_data/parameters.csv)
                                                 html.Div(
                                                     style={"height": "600px"},
                                                     id=self.uuid("graph-wrapper"),
+                                                    children=wcc.Graph(
+                                                        config={
+                                                            "displayModeBar": False
+                                                        },
+                                                        id=self.uuid("graph"),
+                                                    ),
                                                 ),
                                                 html.Div(
                                                     children=[
@@ -503,7 +509,7 @@ aggregated_data/parameters.csv)
 
         @app.callback(
             [
-                Output(self.uuid("graph-wrapper"), "children"),
+                Output(self.uuid("graph"), "figure"),
                 Output(self.uuid("volume_title"), "children"),
             ],
             [
@@ -635,14 +641,10 @@ aggregated_data/parameters.csv)
                             "marker": {"color": "grey"},
                         },
                     ]
-                figure = wcc.Graph(
-                    config={"displayModeBar": False},
-                    id=self.uuid("graph"),
-                    figure={
-                        "data": figure_data,
-                        "layout": self.theme.create_themed_layout(layout),
-                    },
-                )
+                figure = {
+                    "data": figure_data,
+                    "layout": self.theme.create_themed_layout(layout),
+                }
             elif plot_type == "Per sensitivity case":
                 # One box per sensitivity name
                 layout.update(
@@ -651,26 +653,20 @@ aggregated_data/parameters.csv)
                         "yaxis": {"title": volume_title},
                     }
                 )
-                figure = wcc.Graph(
-                    config={"displayModeBar": False},
-                    id=self.uuid("graph"),
-                    figure={
-                        "data": [
-                            {
-                                "y": senscase_df.groupby("REAL")
-                                .sum()
-                                .reset_index()[response],
-                                "name": f"{sensname} ({senscase})",
-                                "type": "box",
-                            }
-                            for sensname, sensname_df in data.groupby(["SENSNAME"])
-                            for senscase, senscase_df in sensname_df.groupby(
-                                ["SENSCASE"]
-                            )
-                        ],
-                        "layout": self.theme.create_themed_layout(layout),
-                    },
-                )
+                figure = {
+                    "data": [
+                        {
+                            "y": senscase_df.groupby("REAL")
+                            .sum()
+                            .reset_index()[response],
+                            "name": f"{sensname} ({senscase})",
+                            "type": "box",
+                        }
+                        for sensname, sensname_df in data.groupby(["SENSNAME"])
+                        for senscase, senscase_df in sensname_df.groupby(["SENSCASE"])
+                    ],
+                    "layout": self.theme.create_themed_layout(layout),
+                }
             elif plot_type == "Per sensitivity name":
                 # One box per sensitivity name
                 layout.update(
@@ -679,26 +675,22 @@ aggregated_data/parameters.csv)
                         "yaxis": {"title": volume_title},
                     }
                 )
-                figure = wcc.Graph(
-                    config={"displayModeBar": False},
-                    id=self.uuid("graph"),
-                    figure={
-                        "data": [
-                            {
-                                "y": sensname_df.groupby("REAL")
-                                .sum()
-                                .reset_index()[response],
-                                "name": f"{sensname}",
-                                "type": "box",
-                            }
-                            for sensname, sensname_df in data.groupby(["SENSNAME"])
-                        ],
-                        "layout": self.theme.create_themed_layout(layout),
-                    },
-                )
+                figure = {
+                    "data": [
+                        {
+                            "y": sensname_df.groupby("REAL")
+                            .sum()
+                            .reset_index()[response],
+                            "name": f"{sensname}",
+                            "type": "box",
+                        }
+                        for sensname, sensname_df in data.groupby(["SENSNAME"])
+                    ],
+                    "layout": self.theme.create_themed_layout(layout),
+                }
             else:
                 # Should not occur unless plot_type options are changed
-                figure = html.Div("Invalid plot type")
+                raise PreventUpdate
 
             return figure, volume_title
 
@@ -268,10 +268,14 @@ def get_parameters(ensemble_path) -> pd.DataFrame:
 
 @CACHE.memoize(timeout=CACHE.TIMEOUT)
 def render_scatter(ens1, x_col, ens2, y_col, color, density, theme):
+    # Build hover labels with one vectorized string concatenation instead of
+    # formatting row by row in Python.
     if ens1 == ens2:
-        real_text = [f"Realization:{r}" for r in get_parameters(ens1)["REAL"]]
+        real_text = ("Realization:" + get_parameters(ens1)["REAL"].astype(str)).tolist()
     else:
-        real_text = [f"Realization:{r}(x)" for r in get_parameters(ens2)["REAL"]]
+        real_text = (
+            "Realization:" + get_parameters(ens2)["REAL"].astype(str) + "(x)"
+        ).tolist()
 
     x = get_parameters(ens1)[x_col]
     y = get_parameters(ens2)[y_col]
@@ -385,14 +389,18 @@ def get_corr_data(ensemble_path, drop_constants=True):
 @CACHE.memoize(timeout=CACHE.TIMEOUT)
 def render_matrix(ensemble_path, theme, drop_constants=True):
     corrdf = get_corr_data(ensemble_path, drop_constants)
-    # pylint: disable=no-member
-    corrdf = corrdf.mask(np.tril(np.ones(corrdf.shape)).astype(np.bool))
+    # Mask out the lower triangle with a single vectorized NaN store, avoiding
+    # allocation of a full boolean matrix and the DataFrame.mask dispatch.
+    z_values = corrdf.to_numpy(dtype=float, copy=True)
+    z_values[np.tril_indices_from(z_values)] = np.nan
 
     data = {
-        "type": "heatmap",
+        # WebGL rendering keeps large correlation matrices responsive, while
+        # small matrices stay on the sharper SVG heatmap.
+        "type": "heatmapgl" if z_values.size > 100_000 else "heatmap",
         "x": corrdf.columns,
         "y": corrdf.columns,
-        "z": list(corrdf.values),
+        "z": z_values.tolist(),
         "zmin": -1,
         "zmax": 1,
         "colorscale": theme["layout"]["colorscale"]["sequential"],
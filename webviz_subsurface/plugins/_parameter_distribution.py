@@ -201,7 +201,7 @@ and the parameter columns.
                 df = param[param["ENSEMBLE"] == ensemble]
                 iterations.append(ensemble)
                 values.append(df[column].tolist())
-                labels.append([f"Realization {real}" for real in df["REAL"].tolist()])
+                labels.append(("Realization " + df["REAL"].astype(str)).tolist())
 
             return {"iterations": iterations, "values": values, "labels": labels}
 
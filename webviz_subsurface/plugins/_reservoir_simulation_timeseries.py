@@ -181,6 +181,16 @@ folder, to avoid risk of not extracting the right data.
             raise ValueError(
                 'Incorrent arguments. Either provide a "csvfile" or "ensembles"'
             )
+        # Sort once on the grouping columns, so the groupbys in the callbacks
+        # iterate already ordered data and can skip re-sorting.
+        self.smry = self.smry.sort_values(["ENSEMBLE", "REAL", "DATE"]).reset_index(
+            drop=True
+        )
+        # Downcast the vector data to float32. Single precision is well above
+        # plot resolution, and halving the memory footprint also speeds up the
+        # memory-bound statistics aggregations.
+        float_cols = self.smry.select_dtypes(include=["float64"]).columns
+        self.smry[float_cols] = self.smry[float_cols].astype("float32")
         if any([col.startswith(("AVG_", "INTVL_")) for col in self.smry.columns]):
             raise ValueError(
                 "Your data set includes time series vectors which have names starting with"
@@ -193,6 +203,13 @@ folder, to avoid risk of not extracting the right data.
             if c not in ReservoirSimulationTimeSeries.ENSEMBLE_COLUMNS
             and not historical_vector(c, self.smry_meta, False) in self.smry.columns
         ]
+        # Map every vector to its guessed historical vector (or None) once,
+        # instead of re-running the string heuristics in every callback.
+        self.historical_vector_map = {
+            vector: historical_vector(vector=vector, smry_meta=self.smry_meta)
+            for vector in self.smry.columns
+            if vector not in ReservoirSimulationTimeSeries.ENSEMBLE_COLUMNS
+        }
 
         self.dropdown_options = []
         for vec in self.smry_cols:
@@ -223,6 +240,7 @@ folder, to avoid risk of not extracting the right data.
 
         self.ensembles = list(self.smry["ENSEMBLE"].unique())
         self.theme = app.webviz_settings["theme"]
+        self.ens_colors = unique_colors(self.ensembles, self.theme)
         self.plot_options = options if options else {}
         self.plot_options["date"] = (
             str(self.plot_options.get("date"))
@@ -248,10 +266,6 @@ folder, to avoid risk of not extracting the right data.
         self.allow_delta = len(self.ensembles) > 1
         self.set_callbacks(app)
 
-    @property
-    def ens_colors(self):
-        return unique_colors(self.ensembles, self.theme)
-
     @property
     def tour_steps(self):
         return [
@@ -628,6 +642,10 @@ folder, to avoid risk of not extracting the right data.
                 ensembles = ensembles if isinstance(ensembles, list) else [ensembles]
             else:
                 raise PreventUpdate
+            # Nothing to filter or aggregate if the selection is empty, e.g.
+            # when the user has cleared the ensemble dropdown.
+            if not ensembles:
+                raise PreventUpdate
 
             # Retrieve previous/current selected date
             date = json.loads(stored_date) if stored_date else None
@@ -670,7 +688,7 @@ folder, to avoid risk of not extracting the right data.
             legends = []
             dfs = calculate_vector_dataframes(
                 smry=self.smry,
-                smry_meta=self.smry_meta,
+                historical_vector_map=self.historical_vector_map,
                 ensembles=ensembles,
                 vectors=vectors,
                 calc_mode=calc_mode,
@@ -713,14 +731,12 @@ folder, to avoid risk of not extracting the right data.
                 else:
                     raise PreventUpdate
 
-                if (
-                    historical_vector(vector=vector, smry_meta=self.smry_meta)
-                    in dfs[vector]["data"].columns
-                ):
+                history_vector = self.historical_vector_map.get(vector)
+                if history_vector in dfs[vector]["data"].columns:
                     traces.append(
                         add_history_trace(
                             dfs[vector]["data"],
-                            historical_vector(vector=vector, smry_meta=self.smry_meta),
+                            history_vector,
                             line_shape,
                         )
                     )
@@ -803,10 +819,12 @@ folder, to avoid risk of not extracting the right data.
                 ensembles = ensembles if isinstance(ensembles, list) else [ensembles]
             else:
                 raise PreventUpdate
+            if not ensembles:
+                raise PreventUpdate
 
             dfs = calculate_vector_dataframes(
                 smry=self.smry,
-                smry_meta=self.smry_meta,
+                historical_vector_map=self.historical_vector_map,
                 ensembles=ensembles,
                 vectors=vectors,
                 calc_mode=calc_mode,
@@ -871,20 +889,24 @@ folder, to avoid risk of not extracting the right data.
                 else ""
             )
 
-        @app.callback(
+        # Switch displayed ensemble selector for delta/no-delta. This is a pure
+        # style toggle, so it is run clientside to avoid a server roundtrip on
+        # every mode switch.
+        app.clientside_callback(
+            """
+            function(mode) {
+                if (mode === "ensembles") {
+                    return [{"display": "block"}, {"display": "none"}];
+                }
+                return [{"display": "none"}, {"display": "block"}];
+            }
+            """,
             [
                 Output(self.uuid("show_ensembles"), "style"),
                 Output(self.uuid("calc_delta"), "style"),
             ],
             [Input(self.uuid("mode"), "value")],
         )
-        def _update_mode(mode):
-            """Switch displayed ensemble selector for delta/no-delta"""
-            if mode == "ensembles":
-                style = {"display": "block"}, {"display": "none"}
-            else:
-                style = {"display": "none"}, {"display": "block"}
-            return style
 
         @app.callback(
             Output(self.uuid("date"), "data"),
@@ -956,7 +978,7 @@ folder, to avoid risk of not extracting the right data.
 @CACHE.memoize(timeout=CACHE.TIMEOUT)
 def calculate_vector_dataframes(
     smry,
-    smry_meta,
+    historical_vector_map,
     ensembles,
     vectors,
     calc_mode,
@@ -964,11 +986,14 @@ def calculate_vector_dataframes(
     time_index,
     cum_interval,
 ):
+    # Reduce to the selected ensembles once, instead of rescanning the full
+    # ENSEMBLE column for every vector.
+    smry = smry.loc[smry["ENSEMBLE"].isin(ensembles)]
     dfs = {}
     for vector in vectors:
         if vector.startswith("AVG_"):
             total_vector = f"{vector[4:7] + vector[7:].replace('R', 'T', 1)}"
-            data = filter_df(smry, ensembles, total_vector, smry_meta)
+            data = filter_df(smry, total_vector, historical_vector_map)
             data = calc_from_cumulatives(
                 data=data,
                 column_keys=total_vector,
@@ -979,7 +1004,7 @@ def calculate_vector_dataframes(
             vector = rename_vec_from_cum(vector=vector[4:], as_rate=True)
         elif vector.startswith("INTVL_"):
             total_vector = vector.lstrip("INTVL_")
-            data = filter_df(smry, ensembles, total_vector, smry_meta)
+            data = filter_df(smry, total_vector, historical_vector_map)
             data = calc_from_cumulatives(
                 data=data,
                 column_keys=total_vector,
@@ -988,7 +1013,7 @@ def calculate_vector_dataframes(
                 as_rate=False,
             )
         else:
-            data = filter_df(smry, ensembles, vector, smry_meta)
+            data = filter_df(smry, vector, historical_vector_map)
 
         if calc_mode == "delta_ensembles":
             data = calculate_delta(data, ensembles[0], ensembles[1])
@@ -1000,13 +1025,14 @@ def calculate_vector_dataframes(
     return dfs
 
 
-def filter_df(df, ensembles, vector, smry_meta):
-    """Filter dataframe for current vector. Include history
+def filter_df(df, vector, historical_vector_map):
+    """Select the columns needed for the current vector. Include history
     vector if present"""
     columns = ["REAL", "ENSEMBLE", "DATE", vector]
-    if historical_vector(vector=vector, smry_meta=smry_meta) in df.columns:
-        columns.append(historical_vector(vector=vector, smry_meta=smry_meta))
-    return df.loc[df["ENSEMBLE"].isin(ensembles)][columns]
+    history_vector = historical_vector_map.get(vector)
+    if history_vector in df.columns:
+        columns.append(history_vector)
+    return df[columns]
 
 
 def calculate_delta(df, base_ens, delta_ens):
@@ -1034,19 +1060,20 @@ def add_histogram_traces(dframe, vector, date, colors, interval):
         date=date, vector=vector, interval=interval, as_date=True
     )
     data = dframe.loc[dframe[("DATE")] == date]
+    default_color = list(colors.values())[0]
 
     return [
         {
             "type": "histogram",
-            "x": list(ens_df[vector]),
+            "x": ens_df[vector].values.tolist(),
             "name": ensemble,
             "marker": {
-                "color": colors.get(ensemble, colors[list(colors.keys())[0]]),
+                "color": colors.get(ensemble, default_color),
                 "line": {"color": "black", "width": 1},
             },
             "showlegend": False,
         }
-        for ensemble, ens_df in data.groupby(("ENSEMBLE"))
+        for ensemble, ens_df in data.groupby(("ENSEMBLE"), sort=False)
     ]
 
 
@@ -1074,19 +1101,22 @@ def add_observation_trace(obs):
 def add_realization_traces(dframe, vector, colors, line_shape, interval):
     """Renders line trace for each realization, includes history line if present"""
     hovertemplate = render_hovertemplate(vector, interval)
+    default_color = list(colors.values())[0]
     return [
         {
             "line": {"shape": line_shape},
-            "x": list(real_df["DATE"]),
-            "y": list(real_df[vector]),
+            "x": real_df["DATE"].values.tolist(),
+            "y": real_df[vector].values.tolist(),
             "hovertemplate": f"{hovertemplate}Realization: {real}, Ensemble: {ensemble}",
             "name": ensemble,
             "legendgroup": ensemble,
-            "marker": {"color": colors.get(ensemble, colors[list(colors.keys())[0]])},
+            "marker": {"color": colors.get(ensemble, default_color)},
             "showlegend": real_no == 0,
         }
-        for ens_no, (ensemble, ens_df) in enumerate(dframe.groupby("ENSEMBLE"))
-        for real_no, (real, real_df) in enumerate(ens_df.groupby("REAL"))
+        for ens_no, (ensemble, ens_df) in enumerate(
+            dframe.groupby("ENSEMBLE", sort=False)
+        )
+        for real_no, (real, real_df) in enumerate(ens_df.groupby("REAL", sort=False))
     ]
 
 
@@ -1113,15 +1143,17 @@ def add_history_trace(dframe, vector, line_shape):
 def add_statistic_traces(stat_df, vector, colors, line_shape, interval):
     """Add fanchart traces for selected vector"""
     traces = []
+    default_color = list(colors.values())[0]
+    hovertemplate = render_hovertemplate(vector=vector, interval=interval)
     for ensemble, ens_df in stat_df.groupby(("", "ENSEMBLE")):
         traces.extend(
             add_fanchart_traces(
                 ens_stat_df=ens_df,
                 vector=vector,
-                color=colors.get(ensemble, colors[list(colors.keys())[0]]),
+                color=colors.get(ensemble, default_color),
                 legend_group=ensemble,
                 line_shape=line_shape,
-                hovertemplate=render_hovertemplate(vector=vector, interval=interval),
+                hovertemplate=hovertemplate,
             )
         )
     return traces
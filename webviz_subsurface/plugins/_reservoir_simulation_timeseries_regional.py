@@ -222,6 +222,9 @@ folder, to avoid risk of not extracting the right data.
         self.fip_arrays = list(
             {simulation_region_vector_breakdown(col)[1] for col in self.smry_cols}
         )
+        # Computed once here, as the color mapping is static and is accessed
+        # several times per callback.
+        self.groupby_colors = self._create_groupby_colors()
         self.set_callbacks(app)
 
     @property
@@ -321,8 +324,7 @@ folder, to avoid risk of not extracting the right data.
         )
         return [str(i) for i in sorted_int_list]
 
-    @property
-    def groupby_colors(self):
+    def _create_groupby_colors(self):
         color_dict = {"ENSEMBLE": unique_colors(self.ensembles, self.theme)}
         if self.fipdesc is None:
             color_dict.update({"regions": unique_colors(self.all_nodes, self.theme)})
@@ -329,38 +329,28 @@ blob/master/reek_history_match/realization-0/iter-0/status.json).
             """Update main figure
             Dependent on `mode` it will call rendering of the chosen form of visualization
             """
-            if mode == "running_time_matrix" and "filter_short" in filter_short:
-                return render_matrix(
-                    self.job_status_df[
-                        (self.job_status_df["ENSEMBLE"] == ens)
-                        & (self.job_status_df["JOB_MAX_RUNTIME"] >= self.filter_shorter)
-                    ],
-                    rel_runtime,
-                    self.plotly_theme,
-                )
             if mode == "running_time_matrix":
-                return render_matrix(
-                    self.job_status_df[(self.job_status_df["ENSEMBLE"] == ens)],
-                    rel_runtime,
-                    self.plotly_theme,
-                )
+                # Filter the ensemble once, then apply the optional job filter
+                # on the already reduced frame instead of building combined
+                # masks over the full matrix for each option combination.
+                plot_df = self.job_status_df[self.job_status_df["ENSEMBLE"] == ens]
+                if "filter_short" in filter_short:
+                    plot_df = plot_df[plot_df["JOB_MAX_RUNTIME"] >= self.filter_shorter]
+                return render_matrix(plot_df, rel_runtime, self.plotly_theme)
 
             # Otherwise: parallel coordinates
             # Ensure selected parameters is a list
             params = params if isinstance(params, list) else [params]
+            plot_df = self.real_status_df[self.real_status_df["ENSEMBLE"] == ens]
             # Color by success or runtime, for runtime drop unsuccesful
             if rel_real == "Successful/failed realization":
-                plot_df = self.real_status_df[self.real_status_df["ENSEMBLE"] == ens]
                 colormap = make_colormap(
                     self.plotly_theme["layout"]["colorway"], discrete=2
                 )
                 color_by_col = "STATUS_BOOL"
                 colormap_labels = ["Failed", "Success"]
             else:
-                plot_df = self.real_status_df[
-                    (self.real_status_df["ENSEMBLE"] == ens)
-                    & (self.real_status_df["STATUS_BOOL"] == 1)
-                ]
+                plot_df = plot_df[plot_df["STATUS_BOOL"] == 1]
                 colormap = self.plotly_theme["layout"]["colorscale"]["sequential"]
                 color_by_col = "RUNTIME"
                 colormap_labels = None
@@ -431,19 +421,19 @@ def render_matrix(status_df, rel, theme):
     Returns figure object as heatmap for the chosen ensemble and scaling method.
     """
     if rel == "Same job in ensemble":
-        z = list(status_df["JOB_SCALED_RUNTIME"])
+        z = status_df["JOB_SCALED_RUNTIME"].values.tolist()
     elif rel == "Slowest job in realization":
-        z = list(status_df["REAL_SCALED_RUNTIME"])
+        z = status_df["REAL_SCALED_RUNTIME"].values.tolist()
     else:
-        z = list(status_df["ENS_SCALED_RUNTIME"])
+        z = status_df["ENS_SCALED_RUNTIME"].values.tolist()
     data = {
         "type": "heatmap",
-        "x": list(status_df["REAL"]),
-        "y": list(status_df["JOB_ID"]),
+        "x": status_df["REAL"].values.tolist(),
+        "y": status_df["JOB_ID"].values.tolist(),
         "z": z,
         "zmin": 0,
         "zmax": 1,
-        "text": list(status_df["HOVERINFO"]),
+        "text": status_df["HOVERINFO"].values.tolist(),
         "hoverinfo": "text",
         "colorscale": theme["layout"]["colorscale"]["sequential"],
         "colorbar": {
@@ -481,8 +471,8 @@ def render_matrix(status_df, rel, theme):
                 "ticks": "",
                 "showticklabels": True,
                 "tickmode": "array",
-                "tickvals": list(status_df["JOB_ID"]),
-                "ticktext": list(status_df["JOB"]),
+                "tickvals": status_df["JOB_ID"].values.tolist(),
+                "ticktext": status_df["JOB"].values.tolist(),
                 "showgrid": False,
                 "automargin": True,
                 "autorange": "reversed",
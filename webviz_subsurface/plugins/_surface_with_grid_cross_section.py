@@ -15,7 +15,11 @@ from webviz_config.webviz_store import webvizstore
 from webviz_config.utils import calculate_slider_step
 
 from .._datainput.grid import load_grid, load_grid_parameter
-from .._datainput.surface import make_surface_layer, get_surface_fence
+from .._datainput.surface import (
+    load_surface,
+    make_surface_layer,
+    get_surface_fence,
+)
 
 
 class SurfaceWithGridCrossSection(WebvizPluginABC):
@@ -407,7 +411,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
             hillshade,
         ):
 
-            surface = xtgeo.RegularSurface(get_path(surfacepath))
+            surface = load_surface(get_path(surfacepath))
             min_val = None
             max_val = None
             color = None
@@ -450,7 +454,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
                 fence, gridparameter, zincrement=0.5
             )
 
-            surface = xtgeo.RegularSurface(get_path(surfacepath))
+            surface = load_surface(get_path(surfacepath))
             s_arr = get_surface_fence(fence, surface)
             return make_heatmap(
                 values,
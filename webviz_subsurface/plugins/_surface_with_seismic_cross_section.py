@@ -15,7 +15,11 @@ from webviz_config.webviz_store import webvizstore
 from webviz_config.utils import calculate_slider_step
 
 from .._datainput.seismic import load_cube_data
-from .._datainput.surface import make_surface_layer, get_surface_fence
+from .._datainput.surface import (
+    load_surface,
+    make_surface_layer,
+    get_surface_fence,
+)
 
 
 class SurfaceWithSeismicCrossSection(WebvizPluginABC):
@@ -400,7 +404,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
             surfacepath, surface_type, cubepath, color_values, colorscale, hillshade
         ):
 
-            surface = xtgeo.RegularSurface(get_path(surfacepath))
+            surface = load_surface(get_path(surfacepath))
             min_val = None
             max_val = None
             color = None
@@ -438,7 +442,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
             fence = get_fencespec(coords)
             hmin, hmax, vmin, vmax, values = cube.get_randomline(fence)
 
-            surface = xtgeo.RegularSurface(get_path(surfacepath))
+            surface = load_surface(get_path(surfacepath))
             s_arr = get_surface_fence(fence, surface)
             return make_heatmap(
                 values,